@@ -9,67 +9,654 @@ A basic wrapper for the Discord API.
 
 """
 
+from __future__ import annotations
+
 __title__ = 'fusion'
 __author__ = 'Benitz'
 __license__ = 'MIT'
 __copyright__ = 'Copyright 2021-present Benitz'
 __version__ = '2.2.5'
 
-__path__ = __import__('pkgutil').extend_path(__path__, __name__)
-
-import logging
-from typing import Literal, NamedTuple
-
-from . import abc, opus, ui, utils
-#from .timestamp import *
-from .activity import *
-from .appinfo import *
-from .asset import *
-from .audit_logs import *
-from .channel import *
-from .client import *
-from .colour import *
-from .components import *
-from .embeds import *
-from .emoji import *
-from .enums import *
-from .errors import *
-from .file import *
-from .flags import *
-from .guild import *
-from .integrations import *
-from .interactions import *
-from .invite import *
-from .member import *
-from .mentions import *
-from .message import *
-from .object import *
-from .partial_emoji import *
-from .permissions import *
-from .player import *
-from .raw_models import *
-from .reaction import *
-from .role import *
-from .shard import *
-from .stage_instance import *
-from .sticker import *
-from .team import *
-from .template import *
-from .threads import *
-from .user import *
-from .voice_client import *
-from .webhook import *
-from .widget import *
-
-
-class VersionInfo(NamedTuple):
-    major: int
-    minor: int
-    micro: int
-    releaselevel: Literal["alpha", "beta", "candidate", "final"]
-    serial: int
+# imported under a private alias so it does not show up as discord.os
+import os as _os
+
+# typing.TYPE_CHECKING without paying for the typing import at runtime,
+# type checkers read the explicit namespace from __init__.pyi instead
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Any, Callable, Dict, List, Optional
+
+# importlib.reload() re-runs this file in the existing namespace. The one-off
+# work below (the prefetch thread) is not repeated then.
+_reloading = '_LAZY' in globals()
+
+# Public names and submodules (abc, ui, utils, ...) are resolved lazily: the
+# submodule is only imported the first time the name is looked up.
+# -- begin generated exports (tools/freeze_init.py) --
+_LAZY: Dict[str, str] = {
+    # ._primitives
+    'File': '_primitives',
+    'AllowedMentions': '_primitives',
+    'Object': '_primitives',
+
+    # .activity
+    'BaseActivity': 'activity',
+    'Activity': 'activity',
+    'Streaming': 'activity',
+    'Game': 'activity',
+    'Spotify': 'activity',
+    'CustomActivity': 'activity',
+
+    # .appinfo
+    'AppInfo': 'appinfo',
+    'PartialAppInfo': 'appinfo',
+
+    # .asset
+    'Asset': 'asset',
+
+    # .audit_logs
+    'AuditLogDiff': 'audit_logs',
+    'AuditLogChanges': 'audit_logs',
+    'AuditLogEntry': 'audit_logs',
+
+    # .channel
+    'TextChannel': 'channel',
+    'VoiceChannel': 'channel',
+    'StageChannel': 'channel',
+    'DMChannel': 'channel',
+    'CategoryChannel': 'channel',
+    'StoreChannel': 'channel',
+    'GroupChannel': 'channel',
+    'PartialMessageable': 'channel',
+    'Party': 'channel',
+
+    # .client
+    'Client': 'client',
+
+    # .colour
+    'Colour': 'colour',
+    'Color': 'colour',
+
+    # .components
+    'Component': 'components',
+    'ActionRow': 'components',
+    'Button': 'components',
+    'SelectMenu': 'components',
+    'SelectOption': 'components',
+
+    # .embeds
+    'Embed': 'embeds',
+
+    # .emoji
+    'Emoji': 'emoji',
+
+    # .enums
+    'Enum': 'enums',
+    'ChannelType': 'enums',
+    'PartyType': 'enums',
+    'MessageType': 'enums',
+    'VoiceRegion': 'enums',
+    'SpeakingState': 'enums',
+    'VerificationLevel': 'enums',
+    'ContentFilter': 'enums',
+    'Status': 'enums',
+    'DefaultAvatar': 'enums',
+    'AuditLogAction': 'enums',
+    'AuditLogActionCategory': 'enums',
+    'UserFlags': 'enums',
+    'ActivityType': 'enums',
+    'NotificationLevel': 'enums',
+    'TeamMembershipState': 'enums',
+    'WebhookType': 'enums',
+    'ExpireBehaviour': 'enums',
+    'ExpireBehavior': 'enums',
+    'StickerType': 'enums',
+    'StickerFormatType': 'enums',
+    'InviteTarget': 'enums',
+    'VideoQualityMode': 'enums',
+    'ComponentType': 'enums',
+    'ButtonStyle': 'enums',
+    'StagePrivacyLevel': 'enums',
+    'InteractionType': 'enums',
+    'InteractionResponseType': 'enums',
+    'NSFWLevel': 'enums',
+
+    # .errors
+    'ApplicationCommandRegistrationError': 'errors',
+    'CommandError': 'errors',
+    'DisabledCommand': 'errors',
+    'CommandNotFound': 'errors',
+    'NoEntryPointError': 'errors',
+    'ExtensionError': 'errors',
+    'DiscordException': 'errors',
+    'ClientException': 'errors',
+    'NoMoreItems': 'errors',
+    'GatewayNotFound': 'errors',
+    'HTTPException': 'errors',
+    'Forbidden': 'errors',
+    'NotFound': 'errors',
+    'DiscordServerError': 'errors',
+    'InvalidData': 'errors',
+    'InvalidArgument': 'errors',
+    'LoginFailure': 'errors',
+    'ConnectionClosed': 'errors',
+    'PrivilegedIntentsRequired': 'errors',
+    'InteractionResponded': 'errors',
+    'MissingRequiredArgument': 'errors',
+    'BadArgument': 'errors',
+    'PrivateMessageOnly': 'errors',
+    'NoPrivateMessage': 'errors',
+    'CheckFailure': 'errors',
+    'CheckAnyFailure': 'errors',
+    'CommandInvokeError': 'errors',
+    'TooManyArguments': 'errors',
+    'UserInputError': 'errors',
+    'CommandOnCooldown': 'errors',
+    'MaxConcurrencyReached': 'errors',
+    'NotOwner': 'errors',
+    'MessageNotFound': 'errors',
+    'ObjectNotFound': 'errors',
+    'MemberNotFound': 'errors',
+    'GuildNotFound': 'errors',
+    'UserNotFound': 'errors',
+    'ChannelNotFound': 'errors',
+    'ThreadNotFound': 'errors',
+    'ChannelNotReadable': 'errors',
+    'BadColourArgument': 'errors',
+    'BadColorArgument': 'errors',
+    'RoleNotFound': 'errors',
+    'BadInviteArgument': 'errors',
+    'EmojiNotFound': 'errors',
+    'GuildStickerNotFound': 'errors',
+    'PartialEmojiConversionFailure': 'errors',
+    'BadBoolArgument': 'errors',
+    'MissingRole': 'errors',
+    'BotMissingRole': 'errors',
+    'MissingAnyRole': 'errors',
+    'BotMissingAnyRole': 'errors',
+    'MissingPermissions': 'errors',
+    'BotMissingPermissions': 'errors',
+    'NSFWChannelRequired': 'errors',
+    'ConversionError': 'errors',
+    'BadUnionArgument': 'errors',
+    'BadLiteralArgument': 'errors',
+    'ArgumentParsingError': 'errors',
+    'UnexpectedQuoteError': 'errors',
+    'InvalidEndOfQuotedStringError': 'errors',
+    'ExpectedClosingQuoteError': 'errors',
+    'ExtensionAlreadyLoaded': 'errors',
+    'ExtensionNotLoaded': 'errors',
+    'ExtensionFailed': 'errors',
+    'ExtensionNotFound': 'errors',
+    'CommandRegistrationError': 'errors',
+    'FlagError': 'errors',
+    'BadFlagArgument': 'errors',
+    'MissingFlagArgument': 'errors',
+    'TooManyFlags': 'errors',
+    'MissingRequiredFlag': 'errors',
+
+    # .flags
+    'SystemChannelFlags': 'flags',
+    'MessageFlags': 'flags',
+    'PublicUserFlags': 'flags',
+    'Intents': 'flags',
+    'MemberCacheFlags': 'flags',
+    'ApplicationFlags': 'flags',
+
+    # .guild
+    'Guild': 'guild',
+
+    # .integrations
+    'IntegrationAccount': 'integrations',
+    'IntegrationApplication': 'integrations',
+    'Integration': 'integrations',
+    'StreamIntegration': 'integrations',
+    'BotIntegration': 'integrations',
+
+    # .interactions
+    'Interaction': 'interactions',
+    'InteractionMessage': 'interactions',
+    'InteractionResponse': 'interactions',
+
+    # .invite
+    'PartialInviteChannel': 'invite',
+    'PartialInviteGuild': 'invite',
+    'Invite': 'invite',
+
+    # .member
+    'VoiceState': 'member',
+    'Member': 'member',
+
+    # .message
+    'Attachment': 'message',
+    'Message': 'message',
+    'PartialMessage': 'message',
+    'MessageReference': 'message',
+    'DeletedReferencedMessage': 'message',
+
+    # .partial_emoji
+    'PartialEmoji': 'partial_emoji',
+
+    # .permissions
+    'Permissions': 'permissions',
+    'PermissionOverwrite': 'permissions',
+
+    # .player
+    'AudioSource': 'player',
+    'PCMAudio': 'player',
+    'FFmpegAudio': 'player',
+    'FFmpegPCMAudio': 'player',
+    'FFmpegOpusAudio': 'player',
+    'PCMVolumeTransformer': 'player',
+
+    # .raw_models
+    'RawMessageDeleteEvent': 'raw_models',
+    'RawBulkMessageDeleteEvent': 'raw_models',
+    'RawMessageUpdateEvent': 'raw_models',
+    'RawReactionActionEvent': 'raw_models',
+    'RawReactionClearEvent': 'raw_models',
+    'RawReactionClearEmojiEvent': 'raw_models',
+    'RawIntegrationDeleteEvent': 'raw_models',
+
+    # .reaction
+    'Reaction': 'reaction',
+
+    # .role
+    'RoleTags': 'role',
+    'Role': 'role',
+
+    # .shard
+    'AutoShardedClient': 'shard',
+    'ShardInfo': 'shard',
+
+    # .stage_instance
+    'StageInstance': 'stage_instance',
+
+    # .sticker
+    'StickerPack': 'sticker',
+    'StickerItem': 'sticker',
+    'Sticker': 'sticker',
+    'StandardSticker': 'sticker',
+    'GuildSticker': 'sticker',
+
+    # .team
+    'Team': 'team',
+    'TeamMember': 'team',
+
+    # .template
+    'Template': 'template',
+
+    # .threads
+    'Thread': 'threads',
+    'ThreadMember': 'threads',
+
+    # .user
+    'User': 'user',
+    'ClientUser': 'user',
+
+    # .voice_client
+    'VoiceProtocol': 'voice_client',
+    'VoiceClient': 'voice_client',
+
+    # .webhook
+    'Webhook': 'webhook',
+    'WebhookMessage': 'webhook',
+    'PartialWebhookChannel': 'webhook',
+    'PartialWebhookGuild': 'webhook',
+    'SyncWebhook': 'webhook',
+    'SyncWebhookMessage': 'webhook',
+
+    # .widget
+    'WidgetChannel': 'widget',
+    'WidgetMember': 'widget',
+    'Widget': 'widget',
+
+    # submodules
+    'abc': 'abc',
+    'activity': 'activity',
+    'appinfo': 'appinfo',
+    'asset': 'asset',
+    'audit_logs': 'audit_logs',
+    'backoff': 'backoff',
+    'channel': 'channel',
+    'client': 'client',
+    'colour': 'colour',
+    'components': 'components',
+    'const': 'const',
+    'context_managers': 'context_managers',
+    'core': 'core',
+    'embeds': 'embeds',
+    'emoji': 'emoji',
+    'enums': 'enums',
+    'error': 'error',
+    'errors': 'errors',
+    'file': 'file',
+    'flags': 'flags',
+    'gateway': 'gateway',
+    'guild': 'guild',
+    'http': 'http',
+    'integrations': 'integrations',
+    'interactions': 'interactions',
+    'invite': 'invite',
+    'iterators': 'iterators',
+    'member': 'member',
+    'mentions': 'mentions',
+    'message': 'message',
+    'mixins': 'mixins',
+    'object': 'object',
+    'oggparse': 'oggparse',
+    'opus': 'opus',
+    'partial_emoji': 'partial_emoji',
+    'permissions': 'permissions',
+    'player': 'player',
+    'raw_models': 'raw_models',
+    'reaction': 'reaction',
+    'role': 'role',
+    'shard': 'shard',
+    'stage_instance': 'stage_instance',
+    'state': 'state',
+    'sticker': 'sticker',
+    'team': 'team',
+    'template': 'template',
+    'threads': 'threads',
+    'timestamp': 'timestamp',
+    'types': 'types',
+    'ui': 'ui',
+    'user': 'user',
+    'utils': 'utils',
+    'voice_client': 'voice_client',
+    'webhook': 'webhook',
+    'widget': 'widget',
+}
+
+__all__ = (
+    'File',
+    'AllowedMentions',
+    'Object',
+    'BaseActivity',
+    'Activity',
+    'Streaming',
+    'Game',
+    'Spotify',
+    'CustomActivity',
+    'AppInfo',
+    'PartialAppInfo',
+    'Asset',
+    'AuditLogDiff',
+    'AuditLogChanges',
+    'AuditLogEntry',
+    'TextChannel',
+    'VoiceChannel',
+    'StageChannel',
+    'DMChannel',
+    'CategoryChannel',
+    'StoreChannel',
+    'GroupChannel',
+    'PartialMessageable',
+    'Party',
+    'Client',
+    'Colour',
+    'Color',
+    'Component',
+    'ActionRow',
+    'Button',
+    'SelectMenu',
+    'SelectOption',
+    'Embed',
+    'Emoji',
+    'Enum',
+    'ChannelType',
+    'PartyType',
+    'MessageType',
+    'VoiceRegion',
+    'SpeakingState',
+    'VerificationLevel',
+    'ContentFilter',
+    'Status',
+    'DefaultAvatar',
+    'AuditLogAction',
+    'AuditLogActionCategory',
+    'UserFlags',
+    'ActivityType',
+    'NotificationLevel',
+    'TeamMembershipState',
+    'WebhookType',
+    'ExpireBehaviour',
+    'ExpireBehavior',
+    'StickerType',
+    'StickerFormatType',
+    'InviteTarget',
+    'VideoQualityMode',
+    'ComponentType',
+    'ButtonStyle',
+    'StagePrivacyLevel',
+    'InteractionType',
+    'InteractionResponseType',
+    'NSFWLevel',
+    'ApplicationCommandRegistrationError',
+    'CommandError',
+    'DisabledCommand',
+    'CommandNotFound',
+    'NoEntryPointError',
+    'ExtensionError',
+    'DiscordException',
+    'ClientException',
+    'NoMoreItems',
+    'GatewayNotFound',
+    'HTTPException',
+    'Forbidden',
+    'NotFound',
+    'DiscordServerError',
+    'InvalidData',
+    'InvalidArgument',
+    'LoginFailure',
+    'ConnectionClosed',
+    'PrivilegedIntentsRequired',
+    'InteractionResponded',
+    'MissingRequiredArgument',
+    'BadArgument',
+    'PrivateMessageOnly',
+    'NoPrivateMessage',
+    'CheckFailure',
+    'CheckAnyFailure',
+    'CommandInvokeError',
+    'TooManyArguments',
+    'UserInputError',
+    'CommandOnCooldown',
+    'MaxConcurrencyReached',
+    'NotOwner',
+    'MessageNotFound',
+    'ObjectNotFound',
+    'MemberNotFound',
+    'GuildNotFound',
+    'UserNotFound',
+    'ChannelNotFound',
+    'ThreadNotFound',
+    'ChannelNotReadable',
+    'BadColourArgument',
+    'BadColorArgument',
+    'RoleNotFound',
+    'BadInviteArgument',
+    'EmojiNotFound',
+    'GuildStickerNotFound',
+    'PartialEmojiConversionFailure',
+    'BadBoolArgument',
+    'MissingRole',
+    'BotMissingRole',
+    'MissingAnyRole',
+    'BotMissingAnyRole',
+    'MissingPermissions',
+    'BotMissingPermissions',
+    'NSFWChannelRequired',
+    'ConversionError',
+    'BadUnionArgument',
+    'BadLiteralArgument',
+    'ArgumentParsingError',
+    'UnexpectedQuoteError',
+    'InvalidEndOfQuotedStringError',
+    'ExpectedClosingQuoteError',
+    'ExtensionAlreadyLoaded',
+    'ExtensionNotLoaded',
+    'ExtensionFailed',
+    'ExtensionNotFound',
+    'CommandRegistrationError',
+    'FlagError',
+    'BadFlagArgument',
+    'MissingFlagArgument',
+    'TooManyFlags',
+    'MissingRequiredFlag',
+    'SystemChannelFlags',
+    'MessageFlags',
+    'PublicUserFlags',
+    'Intents',
+    'MemberCacheFlags',
+    'ApplicationFlags',
+    'Guild',
+    'IntegrationAccount',
+    'IntegrationApplication',
+    'Integration',
+    'StreamIntegration',
+    'BotIntegration',
+    'Interaction',
+    'InteractionMessage',
+    'InteractionResponse',
+    'PartialInviteChannel',
+    'PartialInviteGuild',
+    'Invite',
+    'VoiceState',
+    'Member',
+    'Attachment',
+    'Message',
+    'PartialMessage',
+    'MessageReference',
+    'DeletedReferencedMessage',
+    'PartialEmoji',
+    'Permissions',
+    'PermissionOverwrite',
+    'AudioSource',
+    'PCMAudio',
+    'FFmpegAudio',
+    'FFmpegPCMAudio',
+    'FFmpegOpusAudio',
+    'PCMVolumeTransformer',
+    'RawMessageDeleteEvent',
+    'RawBulkMessageDeleteEvent',
+    'RawMessageUpdateEvent',
+    'RawReactionActionEvent',
+    'RawReactionClearEvent',
+    'RawReactionClearEmojiEvent',
+    'RawIntegrationDeleteEvent',
+    'Reaction',
+    'RoleTags',
+    'Role',
+    'AutoShardedClient',
+    'ShardInfo',
+    'StageInstance',
+    'StickerPack',
+    'StickerItem',
+    'Sticker',
+    'StandardSticker',
+    'GuildSticker',
+    'Team',
+    'TeamMember',
+    'Template',
+    'Thread',
+    'ThreadMember',
+    'User',
+    'ClientUser',
+    'VoiceProtocol',
+    'VoiceClient',
+    'Webhook',
+    'WebhookMessage',
+    'PartialWebhookChannel',
+    'PartialWebhookGuild',
+    'SyncWebhook',
+    'SyncWebhookMessage',
+    'WidgetChannel',
+    'WidgetMember',
+    'Widget',
+)
+# -- end generated exports --
+
+
+_import_module: Optional[Callable[..., ModuleType]] = None
+
+
+def __getattr__(name: str) -> Any:
+    global _import_module
+    mod_name = _LAZY.get(name)
+    if mod_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    if _import_module is None:
+        from importlib import import_module as _import_module
+
+    module = _import_module('.' + mod_name, __name__)
+    # the submodule may be the first to import logging
+    from ._logging import _configure_logging
+    _configure_logging()
+    value = module if mod_name == name else getattr(module, name)
+    # cache it so the next lookup never reaches __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+def _prefetch() -> None:
+    from importlib import import_module
+
+    try:
+        import_module('.core', __name__)
+    except Exception:
+        # the error resurfaces in the thread that actually needs the name
+        pass
+
+
+class VersionInfo(tuple):
+    # a bare tuple subclass: namedtuple would need collections and an exec'd class body
+    __slots__ = ()
+
+    def __new__(cls, major: int, minor: int, micro: int, releaselevel: str, serial: int) -> VersionInfo:
+        return tuple.__new__(cls, (major, minor, micro, releaselevel, serial))
+
+    def __getnewargs__(self) -> tuple:
+        # pickle and copy recreate the instance through __new__
+        return tuple(self)
+
+    # the namedtuple API that VersionInfo used to provide
+    _fields = ('major', 'minor', 'micro', 'releaselevel', 'serial')
+
+    def _asdict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def _replace(self, **kwargs: Any) -> VersionInfo:
+        values = self._asdict()
+        unknown = kwargs.keys() - values.keys()
+        if unknown:
+            raise ValueError(f'Got unexpected field names: {sorted(unknown)!r}')
+        values.update(kwargs)
+        return type(self)(**values)
+
+    def __repr__(self) -> str:
+        return 'VersionInfo(major={}, minor={}, micro={}, releaselevel={!r}, serial={})'.format(*self)
+
+    major = property(lambda self: self[0])
+    minor = property(lambda self: self[1])
+    micro = property(lambda self: self[2])
+    releaselevel = property(lambda self: self[3])
+    serial = property(lambda self: self[4])
 
 
 version_info: VersionInfo = VersionInfo(major=2, minor=2, micro=5, releaselevel='alpha', serial=0)
 
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Opt-in: import discord.core (the most commonly used types) on a background
+# thread so their file I/O overlaps with the application's own start-up work.
+# Started last, once the package namespace is complete.
+if not _reloading and _os.environ.get('DISCORD_PREFETCH') == '1':
+    import threading as _threading
+    _threading.Thread(target=_prefetch, name='discord-prefetch', daemon=True).start()
@@ -0,0 +1,562 @@
+# This file is generated by tools/freeze_init.py, do not edit it by hand.
+# It spells out the lazily resolved namespace of discord/__init__.py.
+
+from typing import Literal, NamedTuple
+
+from . import abc as abc
+from . import activity as activity
+from . import appinfo as appinfo
+from . import asset as asset
+from . import audit_logs as audit_logs
+from . import backoff as backoff
+from . import channel as channel
+from . import client as client
+from . import colour as colour
+from . import components as components
+from . import const as const
+from . import context_managers as context_managers
+from . import core as core
+from . import embeds as embeds
+from . import emoji as emoji
+from . import enums as enums
+from . import error as error
+from . import errors as errors
+from . import file as file
+from . import flags as flags
+from . import gateway as gateway
+from . import guild as guild
+from . import http as http
+from . import integrations as integrations
+from . import interactions as interactions
+from . import invite as invite
+from . import iterators as iterators
+from . import member as member
+from . import mentions as mentions
+from . import message as message
+from . import mixins as mixins
+from . import object as object
+from . import oggparse as oggparse
+from . import opus as opus
+from . import partial_emoji as partial_emoji
+from . import permissions as permissions
+from . import player as player
+from . import raw_models as raw_models
+from . import reaction as reaction
+from . import role as role
+from . import shard as shard
+from . import stage_instance as stage_instance
+from . import state as state
+from . import sticker as sticker
+from . import team as team
+from . import template as template
+from . import threads as threads
+from . import timestamp as timestamp
+from . import types as types
+from . import ui as ui
+from . import user as user
+from . import utils as utils
+from . import voice_client as voice_client
+from . import webhook as webhook
+from . import widget as widget
+from ._primitives import (
+    File as File,
+    AllowedMentions as AllowedMentions,
+    Object as Object,
+)
+from .activity import (
+    BaseActivity as BaseActivity,
+    Activity as Activity,
+    Streaming as Streaming,
+    Game as Game,
+    Spotify as Spotify,
+    CustomActivity as CustomActivity,
+)
+from .appinfo import (
+    AppInfo as AppInfo,
+    PartialAppInfo as PartialAppInfo,
+)
+from .asset import (
+    Asset as Asset,
+)
+from .audit_logs import (
+    AuditLogDiff as AuditLogDiff,
+    AuditLogChanges as AuditLogChanges,
+    AuditLogEntry as AuditLogEntry,
+)
+from .channel import (
+    TextChannel as TextChannel,
+    VoiceChannel as VoiceChannel,
+    StageChannel as StageChannel,
+    DMChannel as DMChannel,
+    CategoryChannel as CategoryChannel,
+    StoreChannel as StoreChannel,
+    GroupChannel as GroupChannel,
+    PartialMessageable as PartialMessageable,
+    Party as Party,
+)
+from .client import (
+    Client as Client,
+)
+from .colour import (
+    Colour as Colour,
+    Color as Color,
+)
+from .components import (
+    Component as Component,
+    ActionRow as ActionRow,
+    Button as Button,
+    SelectMenu as SelectMenu,
+    SelectOption as SelectOption,
+)
+from .embeds import (
+    Embed as Embed,
+)
+from .emoji import (
+    Emoji as Emoji,
+)
+from .enums import (
+    Enum as Enum,
+    ChannelType as ChannelType,
+    PartyType as PartyType,
+    MessageType as MessageType,
+    VoiceRegion as VoiceRegion,
+    SpeakingState as SpeakingState,
+    VerificationLevel as VerificationLevel,
+    ContentFilter as ContentFilter,
+    Status as Status,
+    DefaultAvatar as DefaultAvatar,
+    AuditLogAction as AuditLogAction,
+    AuditLogActionCategory as AuditLogActionCategory,
+    UserFlags as UserFlags,
+    ActivityType as ActivityType,
+    NotificationLevel as NotificationLevel,
+    TeamMembershipState as TeamMembershipState,
+    WebhookType as WebhookType,
+    ExpireBehaviour as ExpireBehaviour,
+    ExpireBehavior as ExpireBehavior,
+    StickerType as StickerType,
+    StickerFormatType as StickerFormatType,
+    InviteTarget as InviteTarget,
+    VideoQualityMode as VideoQualityMode,
+    ComponentType as ComponentType,
+    ButtonStyle as ButtonStyle,
+    StagePrivacyLevel as StagePrivacyLevel,
+    InteractionType as InteractionType,
+    InteractionResponseType as InteractionResponseType,
+    NSFWLevel as NSFWLevel,
+)
+from .errors import (
+    ApplicationCommandRegistrationError as ApplicationCommandRegistrationError,
+    CommandError as CommandError,
+    DisabledCommand as DisabledCommand,
+    CommandNotFound as CommandNotFound,
+    NoEntryPointError as NoEntryPointError,
+    ExtensionError as ExtensionError,
+    DiscordException as DiscordException,
+    ClientException as ClientException,
+    NoMoreItems as NoMoreItems,
+    GatewayNotFound as GatewayNotFound,
+    HTTPException as HTTPException,
+    Forbidden as Forbidden,
+    NotFound as NotFound,
+    DiscordServerError as DiscordServerError,
+    InvalidData as InvalidData,
+    InvalidArgument as InvalidArgument,
+    LoginFailure as LoginFailure,
+    ConnectionClosed as ConnectionClosed,
+    PrivilegedIntentsRequired as PrivilegedIntentsRequired,
+    InteractionResponded as InteractionResponded,
+    MissingRequiredArgument as MissingRequiredArgument,
+    BadArgument as BadArgument,
+    PrivateMessageOnly as PrivateMessageOnly,
+    NoPrivateMessage as NoPrivateMessage,
+    CheckFailure as CheckFailure,
+    CheckAnyFailure as CheckAnyFailure,
+    CommandInvokeError as CommandInvokeError,
+    TooManyArguments as TooManyArguments,
+    UserInputError as UserInputError,
+    CommandOnCooldown as CommandOnCooldown,
+    MaxConcurrencyReached as MaxConcurrencyReached,
+    NotOwner as NotOwner,
+    MessageNotFound as MessageNotFound,
+    ObjectNotFound as ObjectNotFound,
+    MemberNotFound as MemberNotFound,
+    GuildNotFound as GuildNotFound,
+    UserNotFound as UserNotFound,
+    ChannelNotFound as ChannelNotFound,
+    ThreadNotFound as ThreadNotFound,
+    ChannelNotReadable as ChannelNotReadable,
+    BadColourArgument as BadColourArgument,
+    BadColorArgument as BadColorArgument,
+    RoleNotFound as RoleNotFound,
+    BadInviteArgument as BadInviteArgument,
+    EmojiNotFound as EmojiNotFound,
+    GuildStickerNotFound as GuildStickerNotFound,
+    PartialEmojiConversionFailure as PartialEmojiConversionFailure,
+    BadBoolArgument as BadBoolArgument,
+    MissingRole as MissingRole,
+    BotMissingRole as BotMissingRole,
+    MissingAnyRole as MissingAnyRole,
+    BotMissingAnyRole as BotMissingAnyRole,
+    MissingPermissions as MissingPermissions,
+    BotMissingPermissions as BotMissingPermissions,
+    NSFWChannelRequired as NSFWChannelRequired,
+    ConversionError as ConversionError,
+    BadUnionArgument as BadUnionArgument,
+    BadLiteralArgument as BadLiteralArgument,
+    ArgumentParsingError as ArgumentParsingError,
+    UnexpectedQuoteError as UnexpectedQuoteError,
+    InvalidEndOfQuotedStringError as InvalidEndOfQuotedStringError,
+    ExpectedClosingQuoteError as ExpectedClosingQuoteError,
+    ExtensionAlreadyLoaded as ExtensionAlreadyLoaded,
+    ExtensionNotLoaded as ExtensionNotLoaded,
+    ExtensionFailed as ExtensionFailed,
+    ExtensionNotFound as ExtensionNotFound,
+    CommandRegistrationError as CommandRegistrationError,
+    FlagError as FlagError,
+    BadFlagArgument as BadFlagArgument,
+    MissingFlagArgument as MissingFlagArgument,
+    TooManyFlags as TooManyFlags,
+    MissingRequiredFlag as MissingRequiredFlag,
+)
+from .flags import (
+    SystemChannelFlags as SystemChannelFlags,
+    MessageFlags as MessageFlags,
+    PublicUserFlags as PublicUserFlags,
+    Intents as Intents,
+    MemberCacheFlags as MemberCacheFlags,
+    ApplicationFlags as ApplicationFlags,
+)
+from .guild import (
+    Guild as Guild,
+)
+from .integrations import (
+    IntegrationAccount as IntegrationAccount,
+    IntegrationApplication as IntegrationApplication,
+    Integration as Integration,
+    StreamIntegration as StreamIntegration,
+    BotIntegration as BotIntegration,
+)
+from .interactions import (
+    Interaction as Interaction,
+    InteractionMessage as InteractionMessage,
+    InteractionResponse as InteractionResponse,
+)
+from .invite import (
+    PartialInviteChannel as PartialInviteChannel,
+    PartialInviteGuild as PartialInviteGuild,
+    Invite as Invite,
+)
+from .member import (
+    VoiceState as VoiceState,
+    Member as Member,
+)
+from .message import (
+    Attachment as Attachment,
+    Message as Message,
+    PartialMessage as PartialMessage,
+    MessageReference as MessageReference,
+    DeletedReferencedMessage as DeletedReferencedMessage,
+)
+from .partial_emoji import (
+    PartialEmoji as PartialEmoji,
+)
+from .permissions import (
+    Permissions as Permissions,
+    PermissionOverwrite as PermissionOverwrite,
+)
+from .player import (
+    AudioSource as AudioSource,
+    PCMAudio as PCMAudio,
+    FFmpegAudio as FFmpegAudio,
+    FFmpegPCMAudio as FFmpegPCMAudio,
+    FFmpegOpusAudio as FFmpegOpusAudio,
+    PCMVolumeTransformer as PCMVolumeTransformer,
+)
+from .raw_models import (
+    RawMessageDeleteEvent as RawMessageDeleteEvent,
+    RawBulkMessageDeleteEvent as RawBulkMessageDeleteEvent,
+    RawMessageUpdateEvent as RawMessageUpdateEvent,
+    RawReactionActionEvent as RawReactionActionEvent,
+    RawReactionClearEvent as RawReactionClearEvent,
+    RawReactionClearEmojiEvent as RawReactionClearEmojiEvent,
+    RawIntegrationDeleteEvent as RawIntegrationDeleteEvent,
+)
+from .reaction import (
+    Reaction as Reaction,
+)
+from .role import (
+    RoleTags as RoleTags,
+    Role as Role,
+)
+from .shard import (
+    AutoShardedClient as AutoShardedClient,
+    ShardInfo as ShardInfo,
+)
+from .stage_instance import (
+    StageInstance as StageInstance,
+)
+from .sticker import (
+    StickerPack as StickerPack,
+    StickerItem as StickerItem,
+    Sticker as Sticker,
+    StandardSticker as StandardSticker,
+    GuildSticker as GuildSticker,
+)
+from .team import (
+    Team as Team,
+    TeamMember as TeamMember,
+)
+from .template import (
+    Template as Template,
+)
+from .threads import (
+    Thread as Thread,
+    ThreadMember as ThreadMember,
+)
+from .user import (
+    User as User,
+    ClientUser as ClientUser,
+)
+from .voice_client import (
+    VoiceProtocol as VoiceProtocol,
+    VoiceClient as VoiceClient,
+)
+from .webhook import (
+    Webhook as Webhook,
+    WebhookMessage as WebhookMessage,
+    PartialWebhookChannel as PartialWebhookChannel,
+    PartialWebhookGuild as PartialWebhookGuild,
+    SyncWebhook as SyncWebhook,
+    SyncWebhookMessage as SyncWebhookMessage,
+)
+from .widget import (
+    WidgetChannel as WidgetChannel,
+    WidgetMember as WidgetMember,
+    Widget as Widget,
+)
+
+__all__ = (
+    'File',
+    'AllowedMentions',
+    'Object',
+    'BaseActivity',
+    'Activity',
+    'Streaming',
+    'Game',
+    'Spotify',
+    'CustomActivity',
+    'AppInfo',
+    'PartialAppInfo',
+    'Asset',
+    'AuditLogDiff',
+    'AuditLogChanges',
+    'AuditLogEntry',
+    'TextChannel',
+    'VoiceChannel',
+    'StageChannel',
+    'DMChannel',
+    'CategoryChannel',
+    'StoreChannel',
+    'GroupChannel',
+    'PartialMessageable',
+    'Party',
+    'Client',
+    'Colour',
+    'Color',
+    'Component',
+    'ActionRow',
+    'Button',
+    'SelectMenu',
+    'SelectOption',
+    'Embed',
+    'Emoji',
+    'Enum',
+    'ChannelType',
+    'PartyType',
+    'MessageType',
+    'VoiceRegion',
+    'SpeakingState',
+    'VerificationLevel',
+    'ContentFilter',
+    'Status',
+    'DefaultAvatar',
+    'AuditLogAction',
+    'AuditLogActionCategory',
+    'UserFlags',
+    'ActivityType',
+    'NotificationLevel',
+    'TeamMembershipState',
+    'WebhookType',
+    'ExpireBehaviour',
+    'ExpireBehavior',
+    'StickerType',
+    'StickerFormatType',
+    'InviteTarget',
+    'VideoQualityMode',
+    'ComponentType',
+    'ButtonStyle',
+    'StagePrivacyLevel',
+    'InteractionType',
+    'InteractionResponseType',
+    'NSFWLevel',
+    'ApplicationCommandRegistrationError',
+    'CommandError',
+    'DisabledCommand',
+    'CommandNotFound',
+    'NoEntryPointError',
+    'ExtensionError',
+    'DiscordException',
+    'ClientException',
+    'NoMoreItems',
+    'GatewayNotFound',
+    'HTTPException',
+    'Forbidden',
+    'NotFound',
+    'DiscordServerError',
+    'InvalidData',
+    'InvalidArgument',
+    'LoginFailure',
+    'ConnectionClosed',
+    'PrivilegedIntentsRequired',
+    'InteractionResponded',
+    'MissingRequiredArgument',
+    'BadArgument',
+    'PrivateMessageOnly',
+    'NoPrivateMessage',
+    'CheckFailure',
+    'CheckAnyFailure',
+    'CommandInvokeError',
+    'TooManyArguments',
+    'UserInputError',
+    'CommandOnCooldown',
+    'MaxConcurrencyReached',
+    'NotOwner',
+    'MessageNotFound',
+    'ObjectNotFound',
+    'MemberNotFound',
+    'GuildNotFound',
+    'UserNotFound',
+    'ChannelNotFound',
+    'ThreadNotFound',
+    'ChannelNotReadable',
+    'BadColourArgument',
+    'BadColorArgument',
+    'RoleNotFound',
+    'BadInviteArgument',
+    'EmojiNotFound',
+    'GuildStickerNotFound',
+    'PartialEmojiConversionFailure',
+    'BadBoolArgument',
+    'MissingRole',
+    'BotMissingRole',
+    'MissingAnyRole',
+    'BotMissingAnyRole',
+    'MissingPermissions',
+    'BotMissingPermissions',
+    'NSFWChannelRequired',
+    'ConversionError',
+    'BadUnionArgument',
+    'BadLiteralArgument',
+    'ArgumentParsingError',
+    'UnexpectedQuoteError',
+    'InvalidEndOfQuotedStringError',
+    'ExpectedClosingQuoteError',
+    'ExtensionAlreadyLoaded',
+    'ExtensionNotLoaded',
+    'ExtensionFailed',
+    'ExtensionNotFound',
+    'CommandRegistrationError',
+    'FlagError',
+    'BadFlagArgument',
+    'MissingFlagArgument',
+    'TooManyFlags',
+    'MissingRequiredFlag',
+    'SystemChannelFlags',
+    'MessageFlags',
+    'PublicUserFlags',
+    'Intents',
+    'MemberCacheFlags',
+    'ApplicationFlags',
+    'Guild',
+    'IntegrationAccount',
+    'IntegrationApplication',
+    'Integration',
+    'StreamIntegration',
+    'BotIntegration',
+    'Interaction',
+    'InteractionMessage',
+    'InteractionResponse',
+    'PartialInviteChannel',
+    'PartialInviteGuild',
+    'Invite',
+    'VoiceState',
+    'Member',
+    'Attachment',
+    'Message',
+    'PartialMessage',
+    'MessageReference',
+    'DeletedReferencedMessage',
+    'PartialEmoji',
+    'Permissions',
+    'PermissionOverwrite',
+    'AudioSource',
+    'PCMAudio',
+    'FFmpegAudio',
+    'FFmpegPCMAudio',
+    'FFmpegOpusAudio',
+    'PCMVolumeTransformer',
+    'RawMessageDeleteEvent',
+    'RawBulkMessageDeleteEvent',
+    'RawMessageUpdateEvent',
+    'RawReactionActionEvent',
+    'RawReactionClearEvent',
+    'RawReactionClearEmojiEvent',
+    'RawIntegrationDeleteEvent',
+    'Reaction',
+    'RoleTags',
+    'Role',
+    'AutoShardedClient',
+    'ShardInfo',
+    'StageInstance',
+    'StickerPack',
+    'StickerItem',
+    'Sticker',
+    'StandardSticker',
+    'GuildSticker',
+    'Team',
+    'TeamMember',
+    'Template',
+    'Thread',
+    'ThreadMember',
+    'User',
+    'ClientUser',
+    'VoiceProtocol',
+    'VoiceClient',
+    'Webhook',
+    'WebhookMessage',
+    'PartialWebhookChannel',
+    'PartialWebhookGuild',
+    'SyncWebhook',
+    'SyncWebhookMessage',
+    'WidgetChannel',
+    'WidgetMember',
+    'Widget',
+)
+
+__title__: str
+__author__: str
+__license__: str
+__copyright__: str
+__version__: str
+
+
+class VersionInfo(NamedTuple):
+    major: int
+    minor: int
+    micro: int
+    releaselevel: Literal['alpha', 'beta', 'candidate', 'final']
+    serial: int
+
+
+version_info: VersionInfo
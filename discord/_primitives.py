@@ -0,0 +1,338 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import (TYPE_CHECKING, Any, List, Optional, SupportsInt, Type,
+                    TypeVar, Union)
+
+from . import utils
+from .mixins import Hashable
+
+if TYPE_CHECKING:
+    import datetime
+
+    from .abc import Snowflake
+    from .types.message import AllowedMentions as AllowedMentionsPayload
+
+    SupportsIntCast = Union[SupportsInt, str, bytes, bytearray]
+
+# Small, dependency-free leaf types that nearly every other module needs.
+# They live in one module so they cost a single import; discord.file,
+# discord.mentions and discord.object re-export them for compatibility.
+
+__all__ = (
+    'File',
+    'AllowedMentions',
+    'Object',
+)
+
+
+class File:
+    r"""A parameter object used for :meth:`abc.Messageable.send`
+    for sending file objects.
+
+    .. note::
+
+        File objects are single use and are not meant to be reused in
+        multiple :meth:`abc.Messageable.send`\s.
+
+    Attributes
+    -----------
+    fp: Union[:class:`os.PathLike`, :class:`io.BufferedIOBase`]
+        A file-like object opened in binary mode and read mode
+        or a filename representing a file in the hard drive to
+        open.
+
+        .. note::
+
+            If the file-like object passed is opened via ``open`` then the
+            modes 'rb' should be used.
+
+            To pass binary data, consider usage of ``io.BytesIO``.
+
+    filename: Optional[:class:`str`]
+        The filename to display when uploading to Discord.
+        If this is not given then it defaults to ``fp.name`` or if ``fp`` is
+        a string then the ``filename`` will default to the string given.
+    spoiler: :class:`bool`
+        Whether the attachment is a spoiler.
+    """
+
+    __slots__ = ('fp', 'filename', 'spoiler', '_original_pos', '_owner', '_closer')
+
+    if TYPE_CHECKING:
+        fp: io.BufferedIOBase
+        filename: Optional[str]
+        spoiler: bool
+
+    def __init__(
+        self,
+        fp: Union[str, bytes, os.PathLike, io.BufferedIOBase],
+        filename: Optional[str] = None,
+        *,
+        spoiler: bool = False,
+    ):
+        if isinstance(fp, io.IOBase):
+            if not (fp.seekable() and fp.readable()):
+                raise ValueError(f'ERROR: File buffer {fp!r} must be seekable and readable')
+            self.fp = fp
+            self._original_pos = fp.tell()
+            self._owner = False
+        else:
+            self.fp = open(fp, 'rb')
+            self._original_pos = 0
+            self._owner = True
+
+        # aiohttp only uses two methods from IOBase
+        # read and close, since I want to control when the files
+        # close, I need to stub it so it doesn't close unless
+        # I tell it to
+        self._closer = self.fp.close
+        self.fp.close = lambda: None
+
+        if filename is None:
+            if isinstance(fp, str):
+                _, self.filename = os.path.split(fp)
+            else:
+                self.filename = getattr(fp, 'name', None)
+        else:
+            self.filename = filename
+
+        if spoiler and self.filename is not None and not self.filename.startswith('SPOILER_'):
+            self.filename = 'SPOILER_' + self.filename
+
+        self.spoiler = spoiler or (self.filename is not None and self.filename.startswith('SPOILER_'))
+
+    def reset(self, *, seek: Union[int, bool] = True) -> None:
+        # The `seek` parameter is needed because
+        # the retry-loop is iterated over multiple times
+        # starting from 0, as an implementation quirk
+        # the resetting must be done at the beginning
+        # before a request is done, since the first index
+        # is 0, and thus false, then this prevents an
+        # unnecessary seek since it's the first request
+        # done.
+        if seek:
+            self.fp.seek(self._original_pos)
+
+    def close(self) -> None:
+        self.fp.close = self._closer
+        if self._owner:
+            self._closer()
+
+
+class _FakeBool:
+    def __repr__(self):
+        return 'True'
+
+    def __eq__(self, other):
+        return other is True
+
+    def __bool__(self):
+        return True
+
+
+default: Any = _FakeBool()
+
+A = TypeVar('A', bound='AllowedMentions')
+
+
+class AllowedMentions:
+    """A class that represents what mentions are allowed in a message.
+
+    This class can be set during :class:`Client` initialisation to apply
+    to every message sent. It can also be applied on a per message basis
+    via :meth:`abc.Messageable.send` for more fine-grained control.
+
+    Attributes
+    ------------
+    everyone: :class:`bool`
+        Whether to allow everyone and here mentions. Defaults to ``True``.
+    users: Union[:class:`bool`, List[:class:`abc.Snowflake`]]
+        Controls the users being mentioned. If ``True`` (the default) then
+        users are mentioned based on the message content. If ``False`` then
+        users are not mentioned at all. If a list of :class:`abc.Snowflake`
+        is given then only the users provided will be mentioned, provided those
+        users are in the message content.
+    roles: Union[:class:`bool`, List[:class:`abc.Snowflake`]]
+        Controls the roles being mentioned. If ``True`` (the default) then
+        roles are mentioned based on the message content. If ``False`` then
+        roles are not mentioned at all. If a list of :class:`abc.Snowflake`
+        is given then only the roles provided will be mentioned, provided those
+        roles are in the message content.
+    replied_user: :class:`bool`
+        Whether to mention the author of the message being replied to. Defaults
+        to ``True``.
+
+        .. versionadded:: 1.6
+    """
+
+    __slots__ = ('everyone', 'users', 'roles', 'replied_user')
+
+    def __init__(
+        self,
+        *,
+        everyone: bool = default,
+        users: Union[bool, List[Snowflake]] = default,
+        roles: Union[bool, List[Snowflake]] = default,
+        replied_user: bool = default,
+    ):
+        self.everyone = everyone
+        self.users = users
+        self.roles = roles
+        self.replied_user = replied_user
+
+    @classmethod
+    def all(cls: Type[A]) -> A:
+        """A factory method that returns a :class:`AllowedMentions` with all fields explicitly set to ``True``
+
+        .. versionadded:: 1.5
+        """
+        return cls(everyone=True, users=True, roles=True, replied_user=True)
+
+    @classmethod
+    def none(cls: Type[A]) -> A:
+        """A factory method that returns a :class:`AllowedMentions` with all fields set to ``False``
+
+        .. versionadded:: 1.5
+        """
+        return cls(everyone=False, users=False, roles=False, replied_user=False)
+
+    
+    @classmethod
+    def default(cls: Type[A]) -> A:
+        """A factory method that returns a :class:`AllowedMentions` with all potential massive ping fields explicitly set to ``False``
+
+        .. versionadded:: 2.0
+        """
+        return cls(everyone=False, users=True, roles=False, replied_user=True)
+    
+
+    def to_dict(self) -> AllowedMentionsPayload:
+        parse = []
+        data = {}
+
+        if self.everyone:
+            parse.append('everyone')
+
+        if self.users == True:
+            parse.append('users')
+        elif self.users != False:
+            data['users'] = [x.id for x in self.users]
+
+        if self.roles == True:
+            parse.append('roles')
+        elif self.roles != False:
+            data['roles'] = [x.id for x in self.roles]
+
+        if self.replied_user:
+            data['replied_user'] = True
+
+        data['parse'] = parse
+        return data  # type: ignore
+
+    def merge(self, other: AllowedMentions) -> AllowedMentions:
+        # Creates a new AllowedMentions by merging from another one.
+        # Merge is done by using the 'self' values unless explicitly
+        # overridden by the 'other' values.
+        everyone = self.everyone if other.everyone is default else other.everyone
+        users = self.users if other.users is default else other.users
+        roles = self.roles if other.roles is default else other.roles
+        replied_user = self.replied_user if other.replied_user is default else other.replied_user
+        return AllowedMentions(everyone=everyone, roles=roles, users=users, replied_user=replied_user)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(everyone={self.everyone}, '
+            f'users={self.users}, roles={self.roles}, replied_user={self.replied_user})'
+        )
+
+
+class Object(Hashable):
+    """Represents a generic Discord object.
+
+    The purpose of this class is to allow you to create 'miniature'
+    versions of data classes if you want to pass in just an ID. Most functions
+    that take in a specific data class with an ID can also take in this class
+    as a substitute instead. Note that even though this is the case, not all
+    objects (if any) actually inherit from this class.
+
+    There are also some cases where some websocket events are received
+    in :issue:`strange order <21>` and when such events happened you would
+    receive this class rather than the actual data class. These cases are
+    extremely rare.
+
+    .. container:: operations
+
+        .. describe:: x == y
+
+            Checks if two objects are equal.
+
+        .. describe:: x != y
+
+            Checks if two objects are not equal.
+
+        .. describe:: hash(x)
+
+            Returns the object's hash.
+
+    Attributes
+    -----------
+    id: :class:`int`
+        The ID of the object.
+    """
+
+    def __init__(self, id: SupportsIntCast):
+        try:
+            id = int(id)
+        except ValueError:
+            raise TypeError(f'ERROR: id parameter must be convertable to int not {id.__class__!r}') from None
+        else:
+            self.id = id
+
+    def __repr__(self) -> str:
+        return f'<Object id={self.id!r}>'
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: Returns the snowflake's creation time in UTC."""
+        return utils.snowflake_time(self.id)
+
+    @property
+    def worker_id(self) -> int:
+        """returns the worker id that made the user id when the user id was generate as :class:`int`: """
+        return (self.id & 0x3E0000) >>17
+
+    @property
+    def process_id(self) -> int:
+        """returns the process id that made the user id when the user id was generate as :class:`int`: """
+        return (self.id & 0x1F000) >> 12
+    
+    @property
+    def increment(self) -> int:
+        """returns the increment id that made the user id when the user id was generate as :class:`int`: """
+        return (self.id & 0xFFF)
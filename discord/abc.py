@@ -26,22 +26,21 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import logging
 from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional,
                     Protocol, Sequence, Tuple, TypeVar, Union, overload,
                     runtime_checkable)
 
 from . import utils
+from ._primitives import AllowedMentions, File
 from .context_managers import Typing
 from .enums import ChannelType
 from .errors import ClientException, InvalidArgument
-from .file import File
 from .invite import Invite
 from .iterators import HistoryIterator
-from .mentions import AllowedMentions
 from .permissions import PermissionOverwrite, Permissions
 from .role import Role
 from .sticker import GuildSticker, StickerItem
-from .voice_client import VoiceClient, VoiceProtocol
 
 __all__ = (
     'Snowflake',
@@ -52,7 +51,9 @@ __all__ = (
     'Connectable',
 )
 
-T = TypeVar('T', bound=VoiceProtocol)
+T = TypeVar('T', bound='VoiceProtocol')
+
+_log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -75,6 +76,7 @@ if TYPE_CHECKING:
         PermissionOverwrite as PermissionOverwritePayload
     from .ui.view import View
     from .user import ClientUser
+    from .voice_client import VoiceProtocol
 
     PartialMessageableChannel = Union[TextChannel, Thread, DMChannel, PartialMessageable]
     MessageableChannel = Union[PartialMessageableChannel, GroupChannel]
@@ -1659,7 +1661,7 @@ class Connectable(Protocol):
         *,
         timeout: float = 60.0,
         reconnect: bool = True,
-        cls: Callable[[Client, Connectable], T] = VoiceClient,
+        cls: Callable[[Client, Connectable], T] = MISSING,
     ) -> T:
         """|coro|
 
@@ -1695,12 +1697,22 @@ class Connectable(Protocol):
             A voice client that is fully connected to the voice server.
         """
 
+        # voice support (opus, the audio player) is only loaded once it is used
+        from .voice_client import VoiceClient, VoiceProtocol
+
+        if VoiceClient.warn_nacl:
+            VoiceClient.warn_nacl = False
+            _log.warning("PyNaCl is not installed, voice will NOT be supported")
+
         key_id, _ = self._get_voice_client_key()
         state = self._state
 
         if state._get_voice_client(key_id):
             raise ClientException('Already connected to a voice channel.')
 
+        if cls is MISSING:
+            cls = VoiceClient  # type: ignore
+
         client = state._get_client()
         voice = cls(client, self)
 
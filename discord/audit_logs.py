@@ -28,11 +28,11 @@ from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generator,
                     List, Optional, Tuple, Type, TypeVar, Union)
 
 from . import enums, utils
+from ._primitives import Object
 from .asset import Asset
 from .colour import Colour
 from .invite import Invite
 from .mixins import Hashable
-from .object import Object
 from .permissions import PermissionOverwrite, Permissions
 
 __all__ = (
@@ -33,13 +33,13 @@ from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
 import discord.abc
 
 from . import utils
+from ._primitives import Object
 from .asset import Asset
 from .enums import (ChannelType, PartyType, StagePrivacyLevel,
                     VideoQualityMode, VoiceRegion, try_enum)
 from .errors import ClientException, InvalidArgument
 from .iterators import ArchivedThreadIterator
 from .mixins import Hashable
-from .object import Object
 from .permissions import PermissionOverwrite, Permissions
 from .stage_instance import StageInstance
 from .threads import Thread
@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import signal
 import sys
@@ -35,10 +36,13 @@ from typing import (TYPE_CHECKING, Any, Callable, Coroutine, Dict, Generator,
 import aiohttp
 
 from . import utils
+from ._logging import _configure_logging
+from ._primitives import AllowedMentions, Object
 from .activity import ActivityTypes, BaseActivity, create_activity
 from .appinfo import AppInfo
 from .backoff import ExponentialBackoff
-from .channel import PartialMessageable, _threaded_channel_factory
+from .channel import (PartialMessageable, StageChannel,
+                      _threaded_channel_factory)
 from .emoji import Emoji
 from .enums import ChannelType, Status, VoiceRegion
 from .errors import *
@@ -48,8 +52,6 @@ from .guild import Guild
 from .http import HTTPClient
 from .invite import Invite
 from .iterators import GuildIterator
-from .mentions import AllowedMentions
-from .object import Object
 from .stage_instance import StageInstance
 from .state import ConnectionState
 from .sticker import (GuildSticker, StandardSticker, StickerPack,
@@ -59,7 +61,6 @@ from .threads import Thread
 from .ui.view import View
 from .user import ClientUser, User
 from .utils import MISSING
-from .voice_client import VoiceClient
 from .webhook import Webhook
 from .widget import Widget
 
@@ -96,10 +97,11 @@ def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     for task in tasks:
         if task.cancelled():
             continue
-        if task.exception() is not None:
+        exc = task.exception()
+        if exc is not None:
             loop.call_exception_handler({
                 'message': 'Unhandled exception during Client.run shutdown.',
-                'exception': task.exception(),
+                'exception': exc,
                 'task': task
             })
 
@@ -107,6 +109,9 @@ def _cleanup_loop(loop: asyncio.AbstractEventLoop) -> None:
     try:
         _cancel_tasks(loop)
         loop.run_until_complete(loop.shutdown_asyncgens())
+        # Python 3.9+
+        if hasattr(loop, 'shutdown_default_executor'):
+            loop.run_until_complete(loop.shutdown_default_executor())
     finally:
         _log.info('Closing the event loop.')
         loop.close()
@@ -194,6 +199,13 @@ class Client:
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
         .. versionadded:: 2.0
+    max_concurrent_events: Optional[:class:`int`]
+        The maximum number of event handlers that may run at the same time. Handlers
+        dispatched past this limit wait for a running one to finish before they start,
+        which keeps bursts such as the initial ``GUILD_CREATE`` stream from starving
+        the rest of the bot. Defaults to ``None``, meaning no limit.
+
+        .. versionadded:: 2.2.5
 
     Attributes
     -----------
@@ -208,10 +220,13 @@ class Client:
         loop: Optional[asyncio.AbstractEventLoop] = None,
         **options: Any,
     ):
+        _configure_logging()
         # self.ws is set in the connect method
         self.ws: DiscordWebSocket = None  # type: ignore
-        self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
-        self._listeners: Dict[str, List[Tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.loop: asyncio.AbstractEventLoop = loop
+        self._listeners: Dict[str, List[Tuple[asyncio.Future, Optional[Callable[..., bool]]]]] = {}
         self.shard_id: Optional[int] = options.get('shard_id')
         self.shard_count: Optional[int] = options.get('shard_count')
 
@@ -230,17 +245,18 @@ class Client:
         }
 
         self._enable_debug_events: bool = options.pop('enable_debug_events', False)
+        max_concurrent_events: Optional[int] = options.pop('max_concurrent_events', None)
+        self._event_semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_concurrent_events) if max_concurrent_events else None
+        )
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
         self._closed: bool = False
+        self._closed_event: asyncio.Event = asyncio.Event()
         self._ready: asyncio.Event = asyncio.Event()
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
 
-        if VoiceClient.warn_nacl:
-            VoiceClient.warn_nacl = False
-            _log.warning("PyNaCl is not installed, voice will NOT be supported")
-
     # internals
 
     def _get_websocket(self, guild_id: Optional[int] = None, *, shard_id: Optional[int] = None) -> DiscordWebSocket:
@@ -359,10 +375,20 @@ class Client:
             except asyncio.CancelledError:
                 pass
 
+    async def _run_bounded(self, wrapped: Coroutine[Any, Any, None]) -> None:
+        try:
+            async with self._event_semaphore:  # type: ignore
+                await wrapped
+        finally:
+            # never started if the task was cancelled while waiting for a slot
+            wrapped.close()
+
     def _schedule_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> asyncio.Task:
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
+        if self._event_semaphore is not None:
+            wrapped = self._run_bounded(wrapped)
         # Schedules the task
-        return asyncio.create_task(wrapped, name=f'discord.py: {event_name}')
+        return self.loop.create_task(wrapped, name=f'discord.py: {event_name}')
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug('Dispatching event %s', event)
@@ -370,38 +396,44 @@ class Client:
 
         listeners = self._listeners.get(event)
         if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
+            # what a satisfied wait_for resolves to only depends on the arguments
+            if len(args) == 0:
+                value = None
+            elif len(args) == 1:
+                value = args[0]
+            else:
+                value = args
+
+            # rebuilt in one pass, deleting by index is quadratic when many fire at once
+            remaining = []
+            for entry in listeners:
+                future, condition = entry
                 if future.cancelled():
-                    removed.append(i)
+                    continue
+
+                # wait_for without a check is satisfied by any occurrence
+                if condition is None:
+                    future.set_result(value)
                     continue
 
                 try:
                     result = condition(*args)
                 except Exception as exc:
                     future.set_exception(exc)
-                    removed.append(i)
                 else:
                     if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
-
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
+                        future.set_result(value)
+                    else:
+                        remaining.append(entry)
+
+            if remaining:
+                self._listeners[event] = remaining
             else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+                self._listeners.pop(event, None)
 
-        try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
+        # most events have no handler, so avoid raising AttributeError for them
+        coro = getattr(self, method, None)
+        if coro is not None:
             self._schedule_event(coro, method, *args, **kwargs)
 
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
@@ -553,7 +585,13 @@ class Client:
 
                 retry = backoff.delay()
                 _log.exception("Attempting a reconnect in %.2fs", retry)
-                await asyncio.sleep(retry)
+                try:
+                    # wakes up early if close() is called while backing off
+                    await asyncio.wait_for(self._closed_event.wait(), timeout=retry)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    return
                 # Always try to RESUME the connection
                 # If the connection is not RESUME-able then the gateway will invalidate the session.
                 # This is apparently what the official Discord client does.
@@ -568,13 +606,10 @@ class Client:
             return
 
         self._closed = True
+        self._closed_event.set()
 
-        for voice in self.voice_clients:
-            try:
-                await voice.disconnect(force=True)
-            except Exception:
-                # if an error happens during disconnects, disregard it.
-                pass
+        # voice connections are independent of each other, errors during disconnects are disregarded
+        await asyncio.gather(*(voice.disconnect(force=True) for voice in self.voice_clients), return_exceptions=True)
 
         if self.ws is not None and self.ws.open:
             await self.ws.close(code=1000)
@@ -590,6 +625,7 @@ class Client:
         cache cleared.
         """
         self._closed = False
+        self._closed_event.clear()
         self._ready.clear()
         self._connection.clear()
         self.http.recreate()
@@ -643,40 +679,38 @@ class Client:
         """
         loop = self.loop
 
-        try:
-            loop.add_signal_handler(signal.SIGINT, lambda: loop.stop())
-            loop.add_signal_handler(signal.SIGTERM, lambda: loop.stop())
-        except NotImplementedError:
-            pass
-
         async def runner():
+            # a signal shuts the client down gracefully instead of stopping the loop under it
+            stopped = asyncio.Event()
             try:
-                await self.start(*args, **kwargs)
+                loop.add_signal_handler(signal.SIGINT, stopped.set)
+                loop.add_signal_handler(signal.SIGTERM, stopped.set)
+            except NotImplementedError:
+                pass
+
+            start = asyncio.ensure_future(self.start(*args, **kwargs))
+            waiter = asyncio.ensure_future(stopped.wait())
+            try:
+                await asyncio.wait((start, waiter), return_when=asyncio.FIRST_COMPLETED)
             finally:
+                waiter.cancel()
                 if not self.is_closed():
                     await self.close()
 
-        def stop_loop_on_completion(f):
-            loop.stop()
+            if start.done():
+                return start.result()
+
+            _log.info('Received signal to terminate bot and event loop.')
+            start.cancel()
 
-        future = asyncio.ensure_future(runner(), loop=loop)
-        future.add_done_callback(stop_loop_on_completion)
         try:
-            loop.run_forever()
+            return loop.run_until_complete(runner())
         except KeyboardInterrupt:
             _log.info('Received signal to terminate bot and event loop.')
         finally:
-            future.remove_done_callback(stop_loop_on_completion)
             _log.info('Cleaning up tasks.')
             _cleanup_loop(loop)
 
-        if not future.cancelled():
-            try:
-                return future.result()
-            except KeyboardInterrupt:
-                # I am unsure why this gets raised here but suppress it anyway
-                return None
-
     # properties
 
     def is_closed(self) -> bool:
@@ -707,16 +741,15 @@ class Client:
 
         .. versionadded: 2.0
         """
-        if self._connection._status in set(state.value for state in Status):
-            return Status(self._connection._status)
-        return Status.online
+        # the enum's own value map, rather than a set of its values built per access
+        return Status._enum_value_map_.get(self._connection._status, Status.online)
 
     @status.setter
     def status(self, value):
         if value is Status.offline:
             self._connection._status = 'invisible'
         elif isinstance(value, Status):
-            self._connection._status = str(value)
+            self._connection._status = value.value
         else:
             raise TypeError('ERROR: status must derive from Status.')
 
@@ -802,8 +835,6 @@ class Client:
         Optional[:class:`.StageInstance`]
             The returns stage instance of ``None`` if not found.
         """
-        from .channel import StageChannel
-
         channel = self._connection.get_channel(id)
 
         if isinstance(channel, StageChannel):
@@ -891,9 +922,8 @@ class Client:
         :class:`.abc.GuildChannel`
             A channel the client can 'access'.
         """
-
-        for guild in self.guilds:
-            yield from guild.channels
+        # still a generator, so the guilds are only looked at once iteration starts
+        yield from itertools.chain.from_iterable(guild.channels for guild in self.guilds)
 
     def get_all_members(self) -> Generator[Member, None, None]:
         """Returns a generator with every :class:`.Member` the client can see.
@@ -909,8 +939,7 @@ class Client:
         :class:`.Member`
             A member the client can see.
         """
-        for guild in self.guilds:
-            yield from guild.members
+        yield from itertools.chain.from_iterable(guild.members for guild in self.guilds)
 
     # listeners/waiters
 
@@ -919,7 +948,9 @@ class Client:
 
         Waits until the client's internal cache is all ready.
         """
-        await self._ready.wait()
+        # after startup this is nearly always the case, skip creating the wait() coroutine
+        if not self._ready.is_set():
+            await self._ready.wait()
 
     def wait_for(
         self,
@@ -1010,11 +1041,6 @@ class Client:
         """
 
         future = self.loop.create_future()
-        if check is None:
-            def _check(*args):
-                return True
-            check = _check
-
         ev = event.lower()
         try:
             listeners = self._listeners[ev]
@@ -1022,9 +1048,25 @@ class Client:
             listeners = []
             self._listeners[ev] = listeners
 
-        listeners.append((future, check))
+        entry = (future, check)
+        listeners.append(entry)
+        # timed out waiters would otherwise linger until the event fires again
+        future.add_done_callback(lambda fut: self._remove_listener(ev, entry) if fut.cancelled() else None)
         return asyncio.wait_for(future, timeout)
 
+    def _remove_listener(self, event: str, entry: Tuple[asyncio.Future, Optional[Callable[..., bool]]]) -> None:
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            return
+
+        try:
+            listeners.remove(entry)
+        except ValueError:
+            return
+
+        if not listeners:
+            del self._listeners[event]
+
     # event registration
 
     def event(self, coro: Coro) -> Coro:
@@ -1102,17 +1144,7 @@ class Client:
 
         await self.ws.change_presence(activity=activity, status=status_str)
 
-        for guild in self._connection.guilds:
-            me = guild.me
-            if me is None:
-                continue
-
-            if activity is not None:
-                me.activities = (activity,)
-            else:
-                me.activities = ()
-
-            me.status = status
+        self._connection._update_self_presence(activity, status)
 
     # Guild stuff
 
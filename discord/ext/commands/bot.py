@@ -136,13 +136,14 @@ def _is_submodule(parent: str, child: str) -> bool:
 def _unwrap_slash_groups(data: ApplicationCommandInteractionData) -> Tuple[str, List[ApplicationCommandInteractionDataOption]]:
     command_name = data["name"]
     command_options = data.get("options") or []
-    while any(o["type"] in {1, 2} for o in command_options):  # type: ignore
-        for option in command_options:  # type: ignore
-            if option["type"] in {1, 2}:  # type: ignore
-                command_name += f' {option["name"]}'  # type: ignore
-                command_options = option.get("options") or []
+    while True:
+        # one pass per nesting level to find the subcommand (group), if any
+        option = next((o for o in command_options if o["type"] in {1, 2}), None)  # type: ignore
+        if option is None:
+            return command_name, command_options
 
-    return command_name, command_options
+        command_name += f' {option["name"]}'  # type: ignore
+        command_options = option.get("options") or []
 
 
 def _quote_string_safe(string: str) -> str:
@@ -198,8 +199,11 @@ class BotBase(GroupMixin):
         # super() will resolve to Client
         super().dispatch(event_name, *args, **kwargs)  # type: ignore
         ev = 'on_' + event_name
-        for event in self.extra_events.get(ev, []):
-            self._schedule_event(event, ev, *args, **kwargs)  # type: ignore
+        events = self.extra_events.get(ev)
+        if events:
+            schedule = self._schedule_event  # type: ignore
+            for event in events:
+                schedule(event, ev, *args, **kwargs)
 
     async def setup(self):
         await self.create_slash_interaction()
@@ -207,8 +211,10 @@ class BotBase(GroupMixin):
     async def create_slash_interaction(self):
         # Credits to the original code: https://github.com/iDevision/enhanced-discord.py/blob/2.0/discord/ext/commands/bot.py
         commands: defaultdict[Optional[int], List[EditApplicationCommand]] = defaultdict(list)
+        slash_interactions = self.slash_interactions
+        guild_whitelist = self.guild_whitelist
         for command in self.commands:
-            if command.hidden or (command.slash_interaction is None and not self.slash_interactions):
+            if command.hidden or (command.slash_interaction is None and not slash_interactions):
                 continue
 
             try:
@@ -219,26 +225,31 @@ class BotBase(GroupMixin):
             if payload is None:
                 continue
 
-            guilds = command.guild_whitelist or self.guild_whitelist
+            guilds = command.guild_whitelist or guild_whitelist
             if guilds is None:
                 commands[None].append(payload)
             else:
-                for guild in guilds:
+                # a repeated ID would upload the same command name twice
+                for guild in set(guilds):
                     commands[guild].append(payload)
 
         http: HTTPClient = self.http  # type: ignore
-        global_commands = commands.pop(None, None)
         application_id = self.application_id or (await self.application_info()).id  # type: ignore
-        if global_commands is not None:
-            if self.guild_whitelist is None:
-                await http.bulk_upsert_global_commands(payload=global_commands, application_id=application_id)
-            else:
-                for guild in self.guild_whitelist:
-                    await http.bulk_upsert_guild_commands(guild_id=guild, payload=global_commands, application_id=application_id)
+        # every scope is its own rate limit bucket, so a few uploads can run side by side
+        limit = asyncio.Semaphore(4)
+
+        async def upload(guild: Optional[int], payload: List[EditApplicationCommand]) -> None:
+            async with limit:
+                if guild is None:
+                    await http.bulk_upsert_global_commands(payload=payload, application_id=application_id)
+                else:
+                    await http.bulk_upsert_guild_commands(guild_id=guild, payload=payload, application_id=application_id)
 
-        for guild, guild_commands in commands.items():
-            assert guild is not None
-            await http.bulk_upsert_guild_commands(guild_id=guild, payload=guild_commands, application_id=application_id)
+        # wait for every upload before raising, so no failure goes unretrieved
+        results = await asyncio.gather(*(upload(guild, payload) for guild, payload in commands.items()), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     @utils.copy_doc(Client.close)
     async def close(self) -> None:
@@ -531,10 +542,7 @@ class BotBase(GroupMixin):
         if not asyncio.iscoroutinefunction(func):
             raise TypeError('ERROR: Listeners must be coroutines')
 
-        if name in self.extra_events:
-            self.extra_events[name].append(func)
-        else:
-            self.extra_events[name] = [func]
+        self.extra_events.setdefault(name, []).append(func)
 
     def remove_listener(self, func: CoroFunc, name: str = MISSING) -> None:
         """Removes a listener from the pool of listeners.
@@ -1154,11 +1162,12 @@ class BotBase(GroupMixin):
             prefix = prefix[0]
 
         ignore_params: List[inspect.Parameter] = []
+        options = {option["name"]: option for option in command_options}
         message.content = f"{prefix}{command_name} "
         for name, param in command.clean_params.items():
             if inspect.isclass(param.annotation) and issubclass(param.annotation, FlagConverter):
                 for name, flag in param.annotation.get_flags().items():
-                    option = next((o for o in command_options if o["name"] == name), None)
+                    option = options.get(name)
 
                     if option is None:
                         if flag.required:
@@ -1169,7 +1178,7 @@ class BotBase(GroupMixin):
                         message.content += f"{prefix}{name} {option['value']}{delimiter}"  # type: ignore
                 continue
 
-            option = next((o for o in command_options if o["name"] == name), None)
+            option = options.get(name)
             if option is None:
                 if param.default is param.empty and not command._is_typing_optional(param.annotation):
                     raise errors.MissingRequiredArgument(param)
@@ -563,7 +563,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             if required:
                 if self._is_typing_optional(param.annotation):
                     return None
-                if hasattr(converter, '__commands_is_flag__') and converter._can_be_constructible():
+                if getattr(converter, '__commands_is_flag__', False) and converter._can_be_constructible():
                     return await converter._construct_default(ctx)
                 raise MissingRequiredArgument(param)
             return param.default
@@ -1171,18 +1171,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             if issubclass(annotation, Converter):
                 annotation = REVERSED_CONVERTER_MAPPING.get(annotation, annotation)
 
-            option["type"] = 3
-            for python_type, discord_type in application_option_type_lookup.items():
-                if issubclass(annotation, python_type):
-                    option["type"] = discord_type
-                    break
+            # most annotations are one of the keys themselves, so try an exact hit first
+            option["type"] = application_option_type_lookup.get(annotation, 3)
+            if option["type"] == 3:
+                for python_type, discord_type in application_option_type_lookup.items():
+                    if issubclass(annotation, python_type):
+                        option["type"] = discord_type
+                        break
 
         elif origin is Literal:
             literal_values = annotation.__args__
             python_type = type(literal_values[0])
             if (
                 all(type(value) == python_type for value in literal_values)
-                and python_type in application_option_type_lookup.keys()
+                and python_type in application_option_type_lookup
             ):
 
                 option["type"] = application_option_type_lookup[python_type]
@@ -1214,7 +1216,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             if options is not None:
                 payload["options"].extend(option for option in options if option is not None)
 
-        payload["options"] = sorted(payload["options"], key=itemgetter("required"), reverse=True)
+        payload["options"].sort(key=itemgetter("required"), reverse=True)
         return payload  # type: ignore
 
 class GroupMixin(Generic[CogT]):
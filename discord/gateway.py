@@ -294,6 +294,8 @@ class DiscordWebSocket:
         return self._rate_limiter.is_ratelimited()
 
     def debug_log_receive(self, data, /):
+        if type(data) is bytes:
+            data = data.decode('utf-8')
         self._dispatch('socket_raw_receive', data)
 
     def log_receive(self, _, /):
@@ -425,8 +427,9 @@ class DiscordWebSocket:
 
             if len(msg) < 4 or msg[-4:] != b'\x00\x00\xff\xff':
                 return
+            # both orjson and json parse the inflated bytes directly,
+            # decoding them to str first would only copy the payload
             msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode('utf-8')
             self._buffer = bytearray()
 
         self.log_receive(msg)
@@ -511,6 +514,10 @@ class DiscordWebSocket:
         else:
             func(data)
 
+        # almost every frame arrives with nobody waiting on it
+        if not self._dispatch_listeners:
+            return
+
         # remove the dispatched listeners
         removed = []
         for index, entry in enumerate(self._dispatch_listeners):
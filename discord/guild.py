@@ -31,6 +31,7 @@ from typing import (TYPE_CHECKING, Any, ClassVar, Dict, List, Literal,
                     overload)
 
 from . import abc, utils
+from ._primitives import File
 from .asset import Asset
 from .channel import *
 from .channel import _guild_channel_factory, _threaded_guild_channel_factory
@@ -41,7 +42,6 @@ from .enums import (AuditLogAction, ChannelType, ContentFilter,
                     VideoQualityMode, VoiceRegion, try_enum)
 from .errors import (ClientException, Forbidden, HTTPException,
                      InvalidArgument, InvalidData)
-from .file import File
 from .flags import SystemChannelFlags
 from .integrations import Integration, _integration_factory
 from .invite import Invite
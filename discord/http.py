@@ -50,8 +50,8 @@ _log = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from ._primitives import File
     from .enums import AuditLogAction, InteractionResponseType
-    from .file import File
     from .types import (appinfo, audit_log, channel, components, embed, emoji,
                         guild, integration, interactions, invite, member,
                         message, role, sticker, template, threads, user, voice,
@@ -1907,6 +1907,8 @@ class InteractionRoute(Route):
     BASE = BASE_API
 
 class InteractionRequest:
+    __slots__ = ('logger', '_discord', '_application_id')
+
     def __init__(self, logger, _discord, application_id):
         self.logger = logger
         self._discord: typing.Union[discord.Client, discord.AutoShardedClient] = _discord
@@ -30,12 +30,12 @@ import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from . import utils
+from ._primitives import Object
 from .channel import ChannelType, PartialMessageable
 from .enums import InteractionResponseType, InteractionType, try_enum
 from .errors import ClientException, HTTPException, InteractionResponded
 from .member import Member
 from .message import Attachment, Message
-from .object import Object
 from .permissions import Permissions
 from .user import User
 from .webhook.async_ import Webhook, async_context, handle_message_parameters
@@ -50,12 +50,11 @@ if TYPE_CHECKING:
     from datetime import datetime
     from aiohttp import ClientSession
 
+    from ._primitives import AllowedMentions, File
     from .channel import (CategoryChannel, PartialMessageable, StageChannel,
                           StoreChannel, TextChannel, VoiceChannel)
     from .embeds import Embed
-    from .file import File
     from .guild import Guild
-    from .mentions import AllowedMentions
     from .state import ConnectionState
     from .threads import Thread
     from .types.interactions import Interaction as InteractionPayload
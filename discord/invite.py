@@ -26,11 +26,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Union
 
+from ._primitives import Object
 from .appinfo import PartialAppInfo
 from .asset import Asset
 from .enums import ChannelType, InviteTarget, VerificationLevel, try_enum
 from .mixins import Hashable
-from .object import Object
 from .utils import _get_as_snowflake, parse_time, snowflake_time
 
 __all__ = (
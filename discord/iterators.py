@@ -29,9 +29,9 @@ import datetime
 from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable,
                     List, Optional, TypeVar, Union)
 
+from ._primitives import Object
 from .audit_logs import AuditLogEntry
 from .errors import NoMoreItems
-from .object import Object
 from .utils import maybe_coroutine, snowflake_time, time_snowflake
 
 __all__ = (
@@ -570,8 +570,9 @@ class GuildIterator(_AsyncIterator['Guild']):
             if self._filter:
                 data = filter(self._filter, data)
 
+            # the queue is unbounded, so there is nothing to wait for per guild
             for element in data:
-                await self.guilds.put(self.create_guild(element))
+                self.guilds.put_nowait(self.create_guild(element))
 
     async def _retrieve_guilds(self, retrieve) -> List[Guild]:
         """Retrieve guilds and update next parameters."""
@@ -35,11 +35,11 @@ from typing import (TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple,
 import discord.abc
 
 from . import utils
+from ._primitives import Object
 from .activity import ActivityTypes, create_activity
 from .asset import Asset
 from .colour import Colour
 from .enums import Status, try_enum
-from .object import Object
 from .permissions import Permissions
 from .user import BaseUser, User, _UserTag
 from .utils import MISSING
@@ -365,15 +365,8 @@ class Member(discord.abc.Messageable, _UserTag):
     def _update(self, data: MemberPayload) -> None:
         # the nickname change is optional,
         # if it isn't in the payload then it didn't change
-        try:
-            self.nick = data['nick']
-        except KeyError:
-            pass
-
-        try:
-            self.pending = data['pending']
-        except KeyError:
-            pass
+        self.nick = data.get('nick', self.nick)
+        self.pending = data.get('pending', self.pending)
 
         self.premium_since = utils.parse_time(data.get('premium_since'))
         self._roles = utils.SnowflakeList(map(int, data['roles']))
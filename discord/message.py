@@ -33,12 +33,12 @@ from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Dict, List,
                     Optional, Tuple, Type, TypeVar, Union, overload)
 
 from . import utils
+from ._primitives import File
 from .components import _component_factory
 from .embeds import Embed
 from .emoji import Emoji
 from .enums import ChannelType, MessageType, try_enum
 from .errors import HTTPException, InvalidArgument
-from .file import File
 from .flags import MessageFlags
 from .guild import Guild
 from .member import Member
@@ -50,12 +50,12 @@ from .threads import Thread
 from .utils import MISSING, escape_mentions
 
 if TYPE_CHECKING:
+    from ._primitives import AllowedMentions
     from .abc import (GuildChannel, MessageableChannel,
                       PartialMessageableChannel, Snowflake)
     from .channel import (DMChannel, GroupChannel, PartialMessageable,
                           TextChannel)
     from .components import Component
-    from .mentions import AllowedMentions
     from .role import Role
     from .state import ConnectionState
     from .types.components import Component as ComponentPayload
@@ -84,6 +84,10 @@ __all__ = (
     'DeletedReferencedMessage',
 )
 
+_USER_MENTION_REGEX = re.compile(r'<@!?([0-9]{15,20})>')
+_CHANNEL_MENTION_REGEX = re.compile(r'<#([0-9]{15,20})>')
+_ROLE_MENTION_REGEX = re.compile(r'<@&([0-9]{15,20})>')
+
 
 def convert_emoji_reaction(emoji):
     if isinstance(emoji, Reaction):
@@ -896,21 +900,21 @@ class Message(Hashable):
         This allows you to receive the user IDs of mentioned users
         even in a private message context.
         """
-        return [int(x) for x in re.findall(r'<@!?([0-9]{15,20})>', self.content)]
+        return [int(x) for x in _USER_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_raw_channel_mentions')
     def raw_channel_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of channel IDs matched with
         the syntax of ``<#channel_id>`` in the message content.
         """
-        return [int(x) for x in re.findall(r'<#([0-9]{15,20})>', self.content)]
+        return [int(x) for x in _CHANNEL_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_raw_role_mentions')
     def raw_role_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of role IDs matched with
         the syntax of ``<@&role_id>`` in the message content.
         """
-        return [int(x) for x in re.findall(r'<@&([0-9]{15,20})>', self.content)]
+        return [int(x) for x in _ROLE_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_channel_mentions')
     def channel_mentions(self) -> List[GuildChannel]:
@@ -445,12 +445,9 @@ class AutoShardedClient(Client):
             return
 
         self._closed = True
+        self._closed_event.set()
 
-        for vc in self.voice_clients:
-            try:
-                await vc.disconnect(force=True)
-            except Exception:
-                pass
+        await asyncio.gather(*(vc.disconnect(force=True) for vc in self.voice_clients), return_exceptions=True)
 
         to_close = [asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()]
         if to_close:
@@ -509,22 +506,11 @@ class AutoShardedClient(Client):
         if shard_id is None:
             for shard in self.__shards.values():
                 await shard.ws.change_presence(activity=activity, status=status_value)
-
-            guilds = self._connection.guilds
         else:
             shard = self.__shards[shard_id]
             await shard.ws.change_presence(activity=activity, status=status_value)
-            guilds = [g for g in self._connection.guilds if g.shard_id == shard_id]
-
-        activities = () if activity is None else (activity,)
-        for guild in guilds:
-            me = guild.me
-            if me is None:
-                continue
 
-            # Member.activities is typehinted as Tuple[ActivityType, ...], we may be setting it as Tuple[BaseActivity, ...]
-            me.activities = activities  # type: ignore
-            me.status = status_enum
+        self._connection._update_self_presence(activity, status_enum, shard_id)
 
     def is_ws_ratelimited(self) -> bool:
         """:class:`bool`: Whether the websocket is currently rate limited.
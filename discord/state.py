@@ -36,6 +36,7 @@ from typing import (TYPE_CHECKING, Any, Callable, Coroutine, Deque, Dict, List,
                     Optional, Sequence, Tuple, TypeVar, Union)
 
 from . import utils
+from ._primitives import AllowedMentions, Object
 from .activity import BaseActivity
 from .channel import *
 from .channel import _channel_factory
@@ -47,9 +48,7 @@ from .integrations import _integration_factory
 from .interactions import Interaction
 from .invite import Invite
 from .member import Member
-from .mentions import AllowedMentions
 from .message import Message
-from .object import Object
 from .partial_emoji import PartialEmoji
 from .raw_models import *
 from .role import Role
@@ -379,6 +378,22 @@ class ConnectionState:
     def _add_guild(self, guild: Guild) -> None:
         self._guilds[guild.id] = guild
 
+    def _update_self_presence(self, activity: Optional[BaseActivity], status: Status, shard_id: Optional[int] = None) -> None:
+        # every guild's member of ourselves shares the same activities tuple
+        activities = () if activity is None else (activity,)
+        self_id = self.self_id
+        for guild in self._guilds.values():
+            if shard_id is not None and guild.shard_id != shard_id:
+                continue
+
+            me = guild.get_member(self_id)  # type: ignore
+            if me is None:
+                continue
+
+            # Member.activities is typehinted as Tuple[ActivityType, ...], we may be setting it as Tuple[BaseActivity, ...]
+            me.activities = activities  # type: ignore
+            me.status = status
+
     def _remove_guild(self, guild: Guild) -> None:
         self._guilds.pop(guild.id, None)
 
@@ -494,22 +494,36 @@ class ViewStore:
             self._synced_message_views[message_id] = view
 
     def remove_view(self, view: View):
-        for item in view.children:
-            if item.is_dispatchable():
-                self._views.pop((item.type.value, item.custom_id), None)  # type: ignore
-
+        message_id: Optional[int] = None
         for key, value in self._synced_message_views.items():
             if value.id == view.id:
+                message_id = key
                 del self._synced_message_views[key]
                 break
 
+        for item in view.children:
+            if item.is_dispatchable():
+                item_key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                entry = self._views.get(item_key)
+                # the key may have been taken over by a newer view since
+                if entry is not None and entry[0] is view:
+                    del self._views[item_key]
+
+    def __get_active(self, key: Tuple[int, Optional[int], str]) -> Optional[Tuple[View, Item]]:
+        value = self._views.get(key)
+        if value is not None and value[0].is_finished():
+            del self._views[key]
+            return None
+        return value
+
     def dispatch(self, component_type: int, custom_id: str, interaction: Interaction):
-        self.__verify_integrity()
+        # finished views are dropped when they are hit here, the full sweep
+        # only runs when a view is added
         message_id: Optional[int] = interaction.message and interaction.message.id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
         # was added without an associated message_id
-        value = self._views.get(key) or self._views.get((component_type, None, custom_id))
+        value = self.__get_active(key) or self.__get_active((component_type, None, custom_id))
         if value is None:
             return
 
@@ -61,6 +61,7 @@ __all__ = (
     'find',
     'get',
     'sleep_until',
+    'install_uvloop',
     'utcnow',
     'remove_markdown',
     'escape_markdown',
@@ -556,6 +557,35 @@ async def sleep_until(when: datetime.datetime, result: Optional[T] = None) -> Op
     return await asyncio.sleep(delta, result)
 
 
+def install_uvloop() -> bool:
+    """Makes asyncio create its event loops with `uvloop <https://github.com/MagicStack/uvloop>`_.
+
+    This changes the process-wide event loop policy, so it has to be called before
+    the :class:`Client` is constructed (or before any loop is created) for the client
+    to run on uvloop. The library never calls it on its own.
+
+    uvloop is installed with the ``speed`` extra and is not available on Windows.
+
+    .. versionadded:: 2.2.5
+
+    Returns
+    --------
+    :class:`bool`
+        Whether the uvloop policy is in effect.
+    """
+    if sys.platform == 'win32':
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def utcnow() -> datetime.datetime:
     """A helper function to return an aware UTC datetime representing the current time.
 
@@ -626,6 +656,10 @@ def _string_width(string: str, *, _IS_ASCII=_IS_ASCII) -> int:
     return sum(2 if func(char) in UNICODE_WIDE_CHAR_TYPE else 1 for char in string)
 
 
+_INVITE_URL_REGEX = re.compile(r'(?:https?\:\/\/)?discord(?:\.gg|(?:app)?\.com\/invite)\/(.+)')
+_TEMPLATE_URL_REGEX = re.compile(r'(?:https?\:\/\/)?discord(?:\.new|(?:app)?\.com\/template)\/(.+)')
+
+
 def resolve_invite(invite: Union[Invite, str]) -> str:
     """
     Resolves an invite from a :class:`~discord.Invite`, URL or code.
@@ -644,9 +678,9 @@ def resolve_invite(invite: Union[Invite, str]) -> str:
 
     if isinstance(invite, Invite):
         return invite.code
-    else:
-        rx = r'(?:https?\:\/\/)?discord(?:\.gg|(?:app)?\.com\/invite)\/(.+)'
-        m = re.match(rx, invite)
+    # a bare code can never match the URL pattern
+    elif '/' in invite:
+        m = _INVITE_URL_REGEX.match(invite)
         if m:
             return m.group(1)
     return invite
@@ -672,9 +706,8 @@ def resolve_template(code: Union[Template, str]) -> str:
 
     if isinstance(code, Template):
         return code.code
-    else:
-        rx = r'(?:https?\:\/\/)?discord(?:\.new|(?:app)?\.com\/template)\/(.+)'
-        m = re.match(rx, code)
+    elif '/' in code:
+        m = _TEMPLATE_URL_REGEX.match(code)
         if m:
             return m.group(1)
     return code
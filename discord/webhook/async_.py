@@ -58,13 +58,12 @@ _log = logging.getLogger(__name__)
 if TYPE_CHECKING:
     import datetime
 
+    from .._primitives import AllowedMentions, File
     from ..abc import Snowflake
     from ..channel import TextChannel
     from ..embeds import Embed
-    from ..file import File
     from ..guild import Guild
     from ..http import Response
-    from ..mentions import AllowedMentions
     from ..state import ConnectionState
     from ..types.message import Message as MessagePayload
     from ..types.webhook import Webhook as WebhookPayload
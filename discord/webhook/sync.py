@@ -55,10 +55,9 @@ __all__ = (
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from .._primitives import AllowedMentions, File
     from ..abc import Snowflake
     from ..embeds import Embed
-    from ..file import File
-    from ..mentions import AllowedMentions
     from ..types.webhook import Webhook as WebhookPayload
 
     try:
@@ -18,6 +18,7 @@ extras_require = {
     ],
     'speed': [
         'orjson>=3.5.4',
+        'uvloop>=0.15.2; sys_platform != "win32"',
     ]
 }
 
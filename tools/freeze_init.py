@@ -0,0 +1,270 @@
+"""
+Regenerates the lazy export table in ``discord/__init__.py`` and the
+``discord/__init__.pyi`` stub that describes the same namespace to tooling.
+
+The table maps every name that used to be star-imported into the top-level
+``discord`` namespace to the submodule that defines it. It is produced by
+reading each submodule's ``__all__`` with :mod:`ast`, so the library itself
+(and its dependencies) do not have to be importable to run this script.
+
+Usage::
+
+    python tools/freeze_init.py          # rewrite the generated files
+    python tools/freeze_init.py --check  # exit with 1 if they are out of date
+
+``--check`` also fails when a module of the package imports a name from
+``discord`` itself that the stub does not declare, since type checkers read
+the stub in place of ``__init__.py``. If mypy is installed it is run over the
+package as well, and its errors for such names are reported too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import pathlib
+import sys
+from typing import Dict, List, Optional
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / 'discord'
+INIT = PACKAGE / '__init__.py'
+STUB = PACKAGE / '__init__.pyi'
+
+BEGIN = '# -- begin generated exports (tools/freeze_init.py) --\n'
+END = '# -- end generated exports --\n'
+
+# Submodules whose public names are re-exported from the top-level namespace,
+# in the order they used to be star-imported.
+EXPORTED = (
+    '_primitives',
+    'activity',
+    'appinfo',
+    'asset',
+    'audit_logs',
+    'channel',
+    'client',
+    'colour',
+    'components',
+    'embeds',
+    'emoji',
+    'enums',
+    'errors',
+    'flags',
+    'guild',
+    'integrations',
+    'interactions',
+    'invite',
+    'member',
+    'message',
+    'partial_emoji',
+    'permissions',
+    'player',
+    'raw_models',
+    'reaction',
+    'role',
+    'shard',
+    'stage_instance',
+    'sticker',
+    'team',
+    'template',
+    'threads',
+    'user',
+    'voice_client',
+    'webhook',
+    'widget',
+)
+
+# Subpackages that are not part of the lazily reachable namespace.
+SKIPPED = frozenset({'bin', 'ext'})
+
+
+def _module_path(name: str) -> pathlib.Path:
+    path = PACKAGE.joinpath(*name.split('.'))
+    if path.is_dir():
+        return path / '__init__.py'
+    return path.with_suffix('.py')
+
+
+def _literal_all(tree: ast.Module) -> Optional[List[str]]:
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == '__all__' for t in node.targets):
+            return list(ast.literal_eval(node.value))
+    return None
+
+
+def exported_names(name: str) -> List[str]:
+    """Returns the names ``from .<name> import *`` would bind."""
+    tree = ast.parse(_module_path(name).read_text(encoding='utf-8'))
+    names = _literal_all(tree)
+    if names is not None:
+        return list(dict.fromkeys(names))
+
+    # packages such as discord.webhook only re-export their own submodules
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.names[0].name == '*':
+            names.extend(exported_names(f'{name}.{node.module}'))
+    return list(dict.fromkeys(names))
+
+
+def submodules() -> List[str]:
+    found = []
+    for path in sorted(PACKAGE.iterdir()):
+        name = path.stem
+        if name.startswith('_') or name in SKIPPED:
+            continue
+        if path.suffix == '.py' or (path / '__init__.py').exists():
+            found.append(name)
+    return found
+
+
+STUB_HEADER = """\
+# This file is generated by tools/freeze_init.py, do not edit it by hand.
+# It spells out the lazily resolved namespace of discord/__init__.py.
+
+from typing import Literal, NamedTuple
+
+"""
+
+STUB_FOOTER = """
+__title__: str
+__author__: str
+__license__: str
+__copyright__: str
+__version__: str
+
+
+class VersionInfo(NamedTuple):
+    major: int
+    minor: int
+    micro: int
+    releaselevel: Literal['alpha', 'beta', 'candidate', 'final']
+    serial: int
+
+
+version_info: VersionInfo
+"""
+
+
+def _exports() -> Dict[str, List[str]]:
+    return {module: exported_names(module) for module in EXPORTED}
+
+
+def render_init(exports: Dict[str, List[str]]) -> str:
+    lines = ['_LAZY: Dict[str, str] = {']
+    for module, names in exports.items():
+        lines.append(f'    # .{module}')
+        lines.extend(f'    {name!r}: {module!r},' for name in names)
+        lines.append('')
+
+    lines.append('    # submodules')
+    lines.extend(f'    {name!r}: {name!r},' for name in submodules())
+    lines.append('}')
+    lines.append('')
+    # submodules stay reachable as attributes, but a star import only binds the
+    # public names, it would otherwise import every submodule eagerly
+    lines.append('__all__ = (')
+    lines.extend(f'    {name!r},' for names in exports.values() for name in names)
+    lines.append(')')
+    return BEGIN + '\n'.join(lines) + '\n' + END
+
+
+def render_stub(exports: Dict[str, List[str]]) -> str:
+    # the redundant "X as X" form marks each name as an explicit re-export
+    lines = [f'from . import {name} as {name}' for name in submodules()]
+    for module, names in exports.items():
+        lines.append(f'from .{module} import (')
+        lines.extend(f'    {name} as {name},' for name in names)
+        lines.append(')')
+
+    lines.append('')
+    lines.append('__all__ = (')
+    lines.extend(f'    {name!r},' for names in exports.values() for name in names)
+    lines.append(')')
+    return STUB_HEADER + '\n'.join(lines) + '\n' + STUB_FOOTER
+
+
+# Names the stub declares besides the exports and the submodules.
+STUB_EXTRAS = frozenset({
+    '__title__', '__author__', '__license__', '__copyright__', '__version__', 'VersionInfo', 'version_info',
+})
+
+
+def undeclared_imports(exports: Dict[str, List[str]]) -> List[str]:
+    """Returns the imports of ``discord`` names by the package's own modules that the stub lacks."""
+    declared = {*STUB_EXTRAS, *submodules(), *(name for names in exports.values() for name in names)}
+    found = []
+    for path in sorted(PACKAGE.rglob('*.py')):
+        if path == INIT:
+            continue
+
+        package = path.relative_to(ROOT).parent.parts
+        for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+            if not isinstance(node, ast.ImportFrom):
+                continue
+            # "from .. import x" only refers to the top-level package from the matching depth
+            if node.level and (node.module is not None or node.level != len(package)):
+                continue
+            if not node.level and node.module != 'discord':
+                continue
+
+            for alias in node.names:
+                if alias.name != '*' and alias.name not in declared:
+                    found.append(f'{path.relative_to(ROOT)}:{node.lineno}: {alias.name!r} is not declared in {STUB.name}')
+    return found
+
+
+def mypy_errors() -> Optional[List[str]]:
+    """Runs mypy over the package and returns its errors for names missing from the stub."""
+    try:
+        from mypy import api
+    except ImportError:
+        return None
+
+    stdout, _, _ = api.run(['--ignore-missing-imports', '--follow-imports=silent', str(PACKAGE)])
+    return [line for line in stdout.splitlines() if 'Module "discord" has no attribute' in line]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--check', action='store_true', help='only check whether the files are up to date')
+    args = parser.parse_args()
+
+    source = INIT.read_text(encoding='utf-8')
+    try:
+        start = source.index(BEGIN)
+        end = source.index(END) + len(END)
+    except ValueError:
+        print(f'{INIT} is missing the generated export markers', file=sys.stderr)
+        return 1
+
+    exports = _exports()
+    outputs = {
+        INIT: source[:start] + render_init(exports) + source[end:],
+        STUB: render_stub(exports),
+    }
+
+    if args.check:
+        stale = [path for path, text in outputs.items() if not path.exists() or path.read_text(encoding='utf-8') != text]
+        for path in stale:
+            print(f'{path} is out of date, run tools/freeze_init.py', file=sys.stderr)
+
+        problems = undeclared_imports(exports)
+        errors = mypy_errors()
+        if errors is None:
+            print('mypy is not installed, skipping the type check of the stub', file=sys.stderr)
+        else:
+            problems.extend(errors)
+
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if stale or problems else 0
+
+    for path, text in outputs.items():
+        path.write_text(text, encoding='utf-8')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())